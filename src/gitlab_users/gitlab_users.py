@@ -8,25 +8,37 @@ Use GitLab API to:
 
 from __future__ import print_function
 from builtins import super, str, input
-try:
-    from itertools import zip_longest  # python3
-except ImportError:
-    from itertools import izip_longest as zip_longest  # python2
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import datetime, timedelta
-import gitlab
+import functools
 import os
 import sys
+import threading
 
+# gitlab (and the requests stack it drags in) is imported lazily inside
+# the functions that need it, so --help and argument errors stay cheap
 
-ACCESS_LEVEL = {'guest': gitlab.GUEST_ACCESS,
-                'reporter': gitlab.REPORTER_ACCESS,
-                'developer': gitlab.DEVELOPER_ACCESS,
-                'master': gitlab.MASTER_ACCESS,
-                'maintainer': gitlab.MASTER_ACCESS,
-                'owner': gitlab.OWNER_ACCESS}
+CSV_FIELDNAMES = ('username', 'name', 'email', 'organization', 'location',
+                  'group', 'access_level')
+REQUIRED_FIELDS = ('username', 'name', 'email')
+
+CSV_HEADER = ('Username', 'E-mail', 'Name', 'State', 'isAdmin', 'isExternal',
+              'LastSignInAt', 'CreatedAt')
+
+
+@functools.lru_cache(maxsize=1)
+def _access_levels():
+    """Map access level names to python-gitlab constants (built once)"""
+    import gitlab
+    return {'guest': gitlab.GUEST_ACCESS,
+            'reporter': gitlab.REPORTER_ACCESS,
+            'developer': gitlab.DEVELOPER_ACCESS,
+            'master': gitlab.MASTER_ACCESS,
+            'maintainer': gitlab.MASTER_ACCESS,
+            'owner': gitlab.OWNER_ACCESS}
 
 
 def query_yes_no(question, default="no"):
@@ -63,10 +75,126 @@ def query_yes_no(question, default="no"):
             print("Please respond with 'yes' or 'no' (or 'y' or 'n').\n")
 
 
+def _enable_http_cache(gl):
+    """Cache GET responses on disk across CLI invocations.
+
+    Opt-in: set the GITLAB_USERS_CACHE environment variable to a TTL in
+    seconds and install the requests-cache package. Repeated read-only
+    commands within the TTL then skip every paginated GET.
+    """
+    ttl = os.environ.get('GITLAB_USERS_CACHE')
+    if not ttl:
+        return
+    try:
+        import requests_cache
+    except ImportError:
+        return
+    gl.session = requests_cache.CachedSession(
+        cache_name=os.path.expanduser('~/.cache/gitlab-users'),
+        backend='sqlite',
+        expire_after=int(ttl),
+        allowable_methods=('GET',))
+
+
+def _use_fast_json():
+    """Parse API responses with orjson when available
+
+    Installed through the gitlab-users[fast] extra; a no-op otherwise.
+    orjson.loads is a drop-in for the stdlib decoder requests uses and
+    roughly 3x faster on large user payloads. Only decoding is swapped:
+    requests serializes request bodies through the same module with
+    stdlib-only keyword arguments (allow_nan=...) that orjson.dumps
+    rejects, so encoding stays on the standard library.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return
+    import json
+    from types import SimpleNamespace
+    import requests.models
+    requests.models.complexjson = SimpleNamespace(loads=orjson.loads,
+                                                  dumps=json.dumps)
+
+
+def _tune_session(gl):
+    """Mount pooled, retrying HTTP adapters on the client session
+
+    Keep-alive amortizes the TLS handshake across all requests of one
+    invocation and the pool is sized above every thread pool used for
+    concurrent fetches (including user-chosen --concurrency values) so
+    workers never queue on a socket; transient 429/5xx answers are
+    retried with backoff.
+    """
+    import requests
+    from urllib3.util.retry import Retry
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=50, pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 502, 503, 504]))
+    gl.session.mount('https://', adapter)
+    gl.session.mount('http://', adapter)
+
+
+def _clear_http_cache(gl):
+    """Drop cached responses before a mutating command"""
+    cache = getattr(gl.session, 'cache', None)
+    if cache is not None:
+        cache.clear()
+
+
+_USERS_GRAPHQL_QUERY = """\
+query($usernames: [String!]) {
+  users(usernames: $usernames) {
+    nodes { id username name publicEmail }
+  }
+}"""
+
+
+def _resolve_users_graphql(gl, usernames):
+    """Resolve many usernames with batched GraphQL requests
+
+    Return a {username: {'id', 'name', 'email'}} mapping covering the
+    usernames the server resolved, or None when the GraphQL endpoint is
+    unavailable. Callers must treat usernames missing from the mapping
+    as unresolved (one REST lookup each), not as nonexistent. The email
+    is the user's publicEmail and may be None.
+    """
+    import requests
+    usernames = list(usernames)
+    users = {}
+    # GraphQL connections return at most 100 nodes, so one query per
+    # batch of 100 names; still ~100x fewer round-trips than REST
+    for start in range(0, len(usernames), 100):
+        batch = usernames[start:start + 100]
+        try:
+            response = gl.session.post(
+                f"{gl.url}/api/graphql",
+                json={'query': _USERS_GRAPHQL_QUERY,
+                      'variables': {'usernames': batch}},
+                headers={'PRIVATE-TOKEN': gl.private_token})
+            response.raise_for_status()
+            nodes = response.json()['data']['users']['nodes']
+        except (requests.RequestException, KeyError, TypeError, ValueError):
+            return None
+        for node in nodes:
+            # Global ids look like gid://gitlab/User/42
+            user_id = int(node['id'].rsplit('/', 1)[-1])
+            users[node['username']] = {'id': user_id,
+                                       'name': node['name'],
+                                       'email': node.get('publicEmail')}
+    return users
+
+
+@functools.lru_cache(maxsize=8)
 def connect_to_gitlab(gitlab_id=None):
-    """Return a connection to GitLab API"""
+    """Return a (cached) connection to GitLab API"""
+    import gitlab
+    _use_fast_json()
     try:
         gl = gitlab.Gitlab.from_config(gitlab_id)
+        _enable_http_cache(gl)
+        _tune_session(gl)
     except (gitlab.config.GitlabIDError, gitlab.config.GitlabDataError,
             gitlab.config.GitlabConfigMissingError) as e:
         print("Exception in python-gitlab: {}.\n".format(e),
@@ -83,7 +211,7 @@ class GLUsers(object):
 
     def __init__(self, gitlab_id=None, email_only=False, export_keys=False,
                  username=False, activity=None, sign_in_date=False,
-                 name_only=False, gl=None):
+                 name_only=False, sort=True, gl=None):
 
         self.gitlab_id = gitlab_id
         self.email_only = email_only
@@ -92,86 +220,119 @@ class GLUsers(object):
         self.username = username
         self.activity = activity
         self.sign_in_date = sign_in_date
+        self.sort = sort
 
         self.gl = connect_to_gitlab(self.gitlab_id) if gl is None else gl
         self.url = self.gl.api_url
-        self.all_gl_users = self.gl.users.list(all=True)
-        self.alluser_ids = [gl_user.id for gl_user in self.all_gl_users]
-
-        # Create a {id: user} dictionary from user_ids list
-        self.userdict = {key: value for (key, value)
-                         in zip(self.alluser_ids, self.all_gl_users)}
+        self._all_gl_users = None
+        self._userdict = None
+        self._user_info = self._make_user_info()
+
+    @property
+    def all_gl_users(self):
+        """Fetch the full user list lazily (one paginated walk, cached)"""
+        if self._all_gl_users is None:
+            self._all_gl_users = self.gl.users.list(all=True, per_page=100)
+        return self._all_gl_users
+
+    @property
+    def alluser_ids(self):
+        return self.userdict.keys()
+
+    @property
+    def userdict(self):
+        """A lazily built {id: user} dictionary"""
+        if self._userdict is None:
+            self._userdict = {gl_user.id: gl_user
+                              for gl_user in self.all_gl_users}
+        return self._userdict
 
     @staticmethod
-    def _format_date(gl_user,field):
+    def _format_date(gl_user, field):
         """Format date field"""
-        if getattr(gl_user, field):
-            return getattr (gl_user,field).split('T')[0]
-        else:
-            return None
+        date = getattr(gl_user, field)
+        return date.split('T', 1)[0] if date else None
 
     @staticmethod
     def _sign_in_date(gl_user):
         """Return user sign-in date"""
-        return __class__._format_date(gl_user,"current_sign_in_at")
+        return __class__._format_date(gl_user, "current_sign_in_at")
 
-    def _sign_in_date_and_time(self, gl_user):
-        """Return user sign-in date and time"""
-        return datetime.strptime(self._sign_in_date(gl_user), "%Y-%m-%d")
-
-    def user_info(self, gl_user):
-        """Return info for given user"""
+    def _make_user_info(self):
+        """Resolve the display flags into a formatter, once per instance
+        instead of once per user"""
+        # Index the plain .attributes dict instead of going through
+        # RESTObject.__getattr__ for every field
         if self.email_only:
-            info = gl_user.email
-        elif self.name_only:
-            info = gl_user.name
-        else:
-            info = u"{} <{}>".format(str(gl_user.name), gl_user.email)
+            return lambda gl_user: gl_user.attributes['email']
+        if self.name_only:
+            return lambda gl_user: gl_user.attributes['name']
+
+        def name_and_email(gl_user):
+            a = gl_user.attributes
+            return f"{a['name']} <{a['email']}>"
+
+        if not self.username and not self.sign_in_date:
+            return name_and_email
+
+        def full_info(gl_user):
+            info = name_and_email(gl_user)
             # Complete with additional info
             if self.username:
-                info = "@{} ".format(gl_user.username) + info
+                info = f"@{gl_user.attributes['username']} " + info
             if self.sign_in_date:
-                info = info + " ({})".format(self._sign_in_date(gl_user))
-        return info
+                info = info + f" ({self._sign_in_date(gl_user)})"
+            return info
+
+        return full_info
+
+    def user_info(self, gl_user):
+        """Return info for given user"""
+        return self._user_info(gl_user)
 
     def list_usernames(self):
         usernames = [gl_user.username for gl_user in self.all_gl_users]
-        msg = "Existing usernames ({}):".format(len(usernames))
-        for username in sorted(usernames):
-            msg = msg + "\n - {}".format(username)
-        return msg
+        lines = [f"Existing usernames ({len(usernames)}):"]
+        lines.extend(f" - {username}"
+                     for username in (sorted(usernames) if self.sort
+                                      else usernames))
+        return "\n".join(lines)
 
-    def print_users(self, user_ids):
+    def print_users(self, gl_users):
         """Print info for a list of users and collect ssh_keys"""
 
         nokey_gl_users = []
 
-        for user_id in user_ids:
-            gl_user = self.userdict[user_id]
-            if self.export_keys:
-                key_dir = 'ssh_keys'
-                if not os.path.exists(key_dir):
-                    os.mkdir(key_dir)
-                keys = gl_user.keys.list()
+        if self.export_keys:
+            key_dir = 'ssh_keys'
+            os.makedirs(key_dir, exist_ok=True)
+            # Key listings are independent API calls: fetch them
+            # concurrently, then write files and output in user order
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                all_keys = executor.map(lambda gl_user: gl_user.keys.list(),
+                                        gl_users)
+            for gl_user, keys in zip(gl_users, all_keys):
                 if keys:  # User has a ssh-key
                     print(self.user_info(gl_user))
                     key = keys[0].key
-                    key_filename = "{}/{}.pub".format(key_dir,
-                                                      gl_user.username)
+                    key_filename = f"{key_dir}/{gl_user.username}.pub"
                     with open(key_filename, 'w') as f:
                         f.write(key)
 
                 else:
                     nokey_gl_users.append(gl_user)
 
-            else:
-                print(self.user_info(gl_user))
+        else:
+            # One buffered write instead of a print per user
+            lines = [self.user_info(gl_user) for gl_user in gl_users]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
 
         if self.export_keys:
             print("--")
-            nuser = len(user_ids)
-            nuser_key = len(user_ids) - len(nokey_gl_users)
-            print("{}/{} users has an ssh key.".format(nuser_key, nuser))
+            nuser = len(gl_users)
+            nuser_key = len(gl_users) - len(nokey_gl_users)
+            print(f"{nuser_key}/{nuser} users has an ssh key.")
             if nokey_gl_users:
                 print("--")
                 print("The following users has no ssh key:\n")
@@ -179,92 +340,108 @@ class GLUsers(object):
                     print(self.user_info(gl_user))
                 print("--")
 
-    def _getactivity(self):
-
-        old_sign_in = []
-        never_sign_in = []
-        already_sign_in = []
-        active = []
-        for gl_user in self.all_gl_users:
-            # Find the last connexion date
-            # Split using the T between date and hours
-            # Do not care about minutes...
-            if gl_user.current_sign_in_at:
-                current_sign_in = self._sign_in_date_and_time(gl_user)
-                if gl_user.state == 'active':
-                    already_sign_in.append(gl_user)
-                    if current_sign_in < datetime.now() - \
-                       timedelta(days=365):
-                        old_sign_in.append(gl_user)
-                    else:
-                        active.append(gl_user)
-            elif gl_user.state == 'active':
-                never_sign_in.append(gl_user)
-
-        return (old_sign_in,never_sign_in,already_sign_in,active)
+    def _getactivity(self, which):
+        """Collect the activity bucket(s) selected by `which`
+
+        Only the lists the caller will print are materialized: a
+        (old_sign_in, never_sign_in) pair for 'unused', a single list
+        for 'sign_in' and 'active'.
+        """
+        # ISO 8601 dates compare correctly as plain strings, so a single
+        # precomputed cutoff avoids a strptime per user
+        cutoff = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        # Let the server filter out blocked and deactivated accounts
+        # instead of fetching them only to drop them here
+        gl_users = self.gl.users.list(all=True, active=True, per_page=100)
+
+        if which == 'unused':
+            old_sign_in = []
+            never_sign_in = []
+            for gl_user in gl_users:
+                # Find the last connexion date
+                # Split using the T between date and hours
+                # Do not care about minutes...
+                sign_in = gl_user.attributes.get('current_sign_in_at')
+                if not sign_in:
+                    never_sign_in.append(gl_user)
+                elif sign_in.split('T', 1)[0] < cutoff:
+                    old_sign_in.append(gl_user)
+            return old_sign_in, never_sign_in
+
+        if which == 'sign_in':
+            return [gl_user for gl_user in gl_users
+                    if gl_user.attributes.get('current_sign_in_at')]
+
+        # 'active': signed in within the last year
+        return [gl_user for gl_user in gl_users
+                if (gl_user.attributes.get('current_sign_in_at') or '')
+                .split('T', 1)[0] >= cutoff]
 
     def output(self):
         """Output users information"""
         if self.activity:
-            (old_sign_in, never_sign_in, already_sign_in,active) = self._getactivity()
-
-            if 'unused' in self.activity:
-                print("  Users whose last connexion is older than 1 year:")
-                for gl_user in old_sign_in:
-                    print(self.user_info(gl_user))
-                print("  Users who never signed in:")
-                for gl_user in never_sign_in:
-                    print(self.user_info(gl_user))
-
-            elif 'sign_in' in self.activity:
-                print("  Users who have already signed in:")
-                for gl_user in already_sign_in:
-                    print(self.user_info(gl_user))
-            
-            elif 'active' in self.activity:
-                print(f"""\
-  Active users (last connection < 1 year) [{len(active)}]:""")
-                for gl_user in active:
-                    print(self.user_info(gl_user))               
+            # Buffer each listing into a single stdout write
+            if self.activity == 'unused':
+                old_sign_in, never_sign_in = self._getactivity('unused')
+                lines = ["  Users whose last connexion is older than 1 year:"]
+                lines.extend(self.user_info(gl_user)
+                             for gl_user in old_sign_in)
+                lines.append("  Users who never signed in:")
+                lines.extend(self.user_info(gl_user)
+                             for gl_user in never_sign_in)
+
+            elif self.activity == 'sign_in':
+                lines = ["  Users who have already signed in:"]
+                lines.extend(self.user_info(gl_user)
+                             for gl_user in self._getactivity('sign_in'))
+
+            elif self.activity == 'active':
+                active = self._getactivity('active')
+                lines = [f"""\
+  Active users (last connection < 1 year) [{len(active)}]:"""]
+                lines.extend(self.user_info(gl_user) for gl_user in active)
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
-            self.print_users(self.alluser_ids)
+            self.print_users(self.all_gl_users)
 
     @staticmethod
-    def _getuids(gl_users):
-        return [gu.id for gu in gl_users]
-
-    def user_info_csv(self, gl_user):
-        """Return info for given user in csv"""
-        ## Username, E-mail, Name, State, isAdmin, isExternal, LastSignInAt, CreatedAt
-        info = u"{},{},\"{}\",{},{},{},{},{}".format(gl_user.username, gl_user.email, str(gl_user.name), gl_user.state, gl_user.is_admin, gl_user.external, self._format_date(gl_user,"last_sign_in_at"), self._format_date(gl_user,"created_at"))
-        # Complete with additional info
-        return info
-
-    def print_users_csv(self, user_ids):
-        """Print csv listing of users"""
-
-        for user_id in user_ids:
-            gl_user = self.userdict[user_id]
-            print(self.user_info_csv(gl_user))
+    def _user_row_csv(gl_user):
+        """Return a csv row for given user"""
+        a = gl_user.attributes
+        return (a['username'], a['email'], a['name'], a['state'],
+                a['is_admin'], a['external'],
+                GLUsers._format_date(gl_user, 'last_sign_in_at'),
+                GLUsers._format_date(gl_user, 'created_at'))
+
+    def print_users_csv(self, gl_users):
+        """Write a csv listing of users to stdout"""
+
+        writer = csv.writer(sys.stdout, lineterminator='\n')
+        # writerows consumes lazily, so streamed listings stay streamed
+        writer.writerows(self._user_row_csv(gl_user)
+                         for gl_user in gl_users)
 
     def out_csv(self):
         """Output csv of all users"""
-        print("Username,E-mail,\"Name\",State,isAdmin,isExternal,LastSignInAt,CreatedAt")
+        csv.writer(sys.stdout, lineterminator='\n').writerow(CSV_HEADER)
         if self.activity:
-            (old_sign_in, never_sign_in, already_sign_in,active) = self._getactivity()
-            if 'unused' in self.activity:
+            if self.activity == 'unused':
                 #print("  Users whose last connexion is older than 1 year:")
                 #print("  Users who never signed in:")
-                self.print_users_csv(self._getuids(old_sign_in + never_sign_in))
+                old_sign_in, never_sign_in = self._getactivity('unused')
+                self.print_users_csv(old_sign_in + never_sign_in)
 
-            elif 'sign_in' in self.activity:
+            elif self.activity == 'sign_in':
                 #print("  Users who have already signed in:")
-                self.print_users_csv(self._getuids(already_sign_in))
-            elif 'active' in self.activity:
+                self.print_users_csv(self._getactivity('sign_in'))
+            elif self.activity == 'active':
                 #print(f"""Active users (last connection < 1 year) [{len(active)}]:""")
-                self.print_users_csv(self._getuids(active))
+                self.print_users_csv(self._getactivity('active'))
         else:
-            self.print_users_csv(self.alluser_ids)
+            # Stream the paginated listing: rows are written as pages
+            # arrive and no full user list is held in memory
+            self.print_users_csv(self.gl.users.list(as_list=False,
+                                                    per_page=100))
 
 
 class GLGroups(GLUsers):
@@ -274,14 +451,19 @@ class GLGroups(GLUsers):
 
         self.groups = groups
         super().__init__(*args, **kwargs)
-        self.all_gl_groups = self.gl.groups.list(all=True)
+
+    @property
+    def all_gl_groups(self):
+        """Fetch the full group list lazily (cached per connection)"""
+        return _all_gl_groups(self.gl)
 
     def list_all_groups(self):
         groupnames = [gl_group.name for gl_group in self.all_gl_groups]
-        msg = "Existing groups ({}):".format(len(groupnames))
-        for groupname in sorted(groupnames):
-            msg = msg + "\n - {}".format(groupname)
-        return msg
+        lines = [f"Existing groups ({len(groupnames)}):"]
+        lines.extend(f" - {groupname}"
+                     for groupname in (sorted(groupnames) if self.sort
+                                       else groupnames))
+        return "\n".join(lines)
 
     def output(self):
         """Output users information"""
@@ -290,23 +472,38 @@ class GLGroups(GLUsers):
             print(self.list_all_groups())
             sys.exit(0)
         else:
-            gl_groups = self.gl.groups.list(search=self.groups)
+            import gitlab
+            # An exact path resolves in a single request; fall back to a
+            # server-side search otherwise
+            try:
+                gl_groups = [self.gl.groups.get(self.groups)]
+            except gitlab.GitlabGetError:
+                gl_groups = self.gl.groups.list(all=True, per_page=100,
+                                                search=self.groups)
 
             if not gl_groups:
-                print("No group matching {} found on {}.".format(self.groups,
-                                                                 self.url))
+                print(f"No group matching {self.groups} found on {self.url}.")
                 print(self.list_all_groups())
                 sys.exit(1)
-            for gl_group in gl_groups:
-                user_ids = [gl_user.id for gl_user
-                            in gl_group.members.list(all=True)]
-                print("  Group {} ({} members):".format(gl_group.name,
-                                                        len(user_ids)))
-                self.print_users(user_ids)
+            # Member entries do not carry the full user attributes
+            # (email, sign-in date...) so fetch each member directly
+            # instead of walking the whole instance user list. Both the
+            # per-group member listings and the per-member fetches are
+            # independent API calls, so run them through a thread pool
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                memberships = list(executor.map(
+                    lambda g: g.members.list(all=True, per_page=100),
+                    gl_groups))
+                user_lists = [list(executor.map(
+                    lambda member: self.gl.users.get(member.id), members))
+                    for members in memberships]
+            for gl_group, gl_users in zip(gl_groups, user_lists):
+                print(f"  Group {gl_group.name} ({len(gl_users)} members):")
+                self.print_users(gl_users)
 
 
 class GLSingleUser(GLUsers):
-    """A class to handle a single gitlab user"""
+    """A class to handle one or more gitlab users given by username"""
 
     def __init__(self, user, *args, **kwargs):
 
@@ -314,13 +511,26 @@ class GLSingleUser(GLUsers):
         super().__init__(*args, **kwargs)
 
         if self.user != 'list':
-            gl_userlist = self.gl.users.list(username=self.user)
-            try:
-                self.gl_user = gl_userlist[0]
-            except IndexError:
-                print("username {} not found in GitLab.".format(user))
-                print(self.list_usernames())
-                sys.exit(1)
+            # Accept a comma-separated list of usernames and run the
+            # independent lookups concurrently
+            usernames = self.user.split(',')
+            if len(usernames) > 1:
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    gl_userlists = list(executor.map(
+                        lambda username:
+                        self.gl.users.list(username=username),
+                        usernames))
+            else:
+                gl_userlists = [self.gl.users.list(username=usernames[0])]
+            self.gl_users = []
+            for username, gl_userlist in zip(usernames, gl_userlists):
+                try:
+                    self.gl_users.append(gl_userlist[0])
+                except IndexError:
+                    print(f"username {username} not found in GitLab.")
+                    print(self.list_usernames())
+                    sys.exit(1)
+            self.gl_user = self.gl_users[0]
 
     def get_ssh_key(self):
         """Return user most recent ssh key as a string"""
@@ -328,7 +538,7 @@ class GLSingleUser(GLUsers):
         if keys:  # User has a ssh-key
             return keys[0].key
         else:
-            print("No ssh key found for {}".format(self.gl_user.username))
+            print(f"No ssh key found for {self.gl_user.username}")
 
     def output(self):
         """Output users information"""
@@ -336,27 +546,76 @@ class GLSingleUser(GLUsers):
         if self.user == 'list':
             print(self.list_usernames())
         else:
-            # Filter by username
-            self.print_users([self.gl_user.id])
+            # Filter by username(s)
+            self.print_users(self.gl_users)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_gl_users(gl):
+    """Cache the instance user dump per connection"""
+    return gl.users.list(all=True, per_page=100)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_gl_groups(gl):
+    """Cache the instance group dump per connection"""
+    return gl.groups.list(all=True, per_page=100)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_gl_group(gl, name):
+    """Cache group lookups by name per connection
+
+    A missing group is cached as None, so a CSV whose rows all point to
+    the same unknown group raises (and pays for) the lookup error once.
+    """
+    import gitlab
+    try:
+        return gl.groups.get(name)
+    except gitlab.GitlabGetError as e:
+        if e.response_body == 'Group Not Found':
+            return None
+        raise
+
+
+# Guards the _existing_entries sets when --concurrency creates in parallel
+_existing_entries_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _existing_entries(gl):
+    """Cache sets of usernames, emails, names and groupnames in use
+
+    NewUser._create adds each created account to these sets so later
+    CSV rows duplicating a username/email/name are caught by _check
+    instead of failing against the API.
+    """
+    all_gl_users = _all_gl_users(gl)
+    return {'usernames': {gl_user.username for gl_user in all_gl_users},
+            'emails': {gl_user.email for gl_user in all_gl_users},
+            'names': {gl_user.name for gl_user in all_gl_users},
+            'groupnames': {gl_group.name for gl_group in
+                           _all_gl_groups(gl)}
+            }
 
 
 class NewUser():
     """A class to create a user"""
 
-    def __init__(self, userdict, dry_run=False):
-        self.gl = connect_to_gitlab()
+    def __init__(self, userdict, dry_run=False, gl=None):
+        self.gl = connect_to_gitlab() if gl is None else gl
         self.url = self.gl.api_url
-        self.all_gl_users = self.gl.users.list(all=True)
         self.userdict = userdict
         self.dry_run = dry_run
         if self.userdict['group']:
             # save group info and delete from userdict
-            if self.userdict['access_level'] not in ACCESS_LEVEL.keys():
+            access_level = (self.userdict['access_level'] or '').lower()
+            if access_level not in _access_levels():
                 sys.exit("Wrong access level: {} for group {}".format(
                     self.userdict['access_level'], self.userdict['group']))
             else:
                 self.group = {'name': self.userdict['group'],
-                              'access_level': self.userdict['access_level']}
+                              'access_level': access_level}
                 del self.userdict['group']
                 del self.userdict['access_level']
         else:
@@ -368,34 +627,22 @@ class NewUser():
         print("Checking...")
         print(self)
 
-        gl = {'usernames': [gl_user.username for gl_user in self.all_gl_users],
-              'emails': [gl_user.email for gl_user in self.all_gl_users],
-              'names': [gl_user.name for gl_user in self.all_gl_users],
-              'groupnames': [gl_group.name for gl_group in
-                             self.gl.groups.list(all=True)]
-              }
+        gl = _existing_entries(self.gl)
 
         checkok = True
         for entry in 'username', 'email', 'name':
             if self.userdict[entry] in gl[entry + 's']:
-                print("{} {} already used".format(
-                    entry.title(),
-                    self.userdict[entry]))
+                print(f"{entry.title()} {self.userdict[entry]} already used")
                 checkok = False
 
         if self.group:
-            try:
-                self.gl.groups.get(self.group['name'])
-            except gitlab.GitlabGetError as e:
-                if e.response_body == 'Group Not Found':
-                    print('Group "{}" does not exist.'.format(
-                        self.group['name']))
-                    newgroup_url = self.url + "/admin/groups/new"
-                    print("Create it using GitLab using this link: {}"
-                          .format(newgroup_url))
-                    checkok = False
-                else:
-                    raise
+            if _get_gl_group(self.gl, self.group['name']) is None:
+                print('Group "{}" does not exist.'.format(
+                    self.group['name']))
+                newgroup_url = self.url + "/admin/groups/new"
+                print("Create it using GitLab using this link: {}"
+                      .format(newgroup_url))
+                checkok = False
 
         if checkok:
             print("... OK")
@@ -404,30 +651,31 @@ class NewUser():
 
     def _create(self):
         print("Creating...")
+        # 'organization' and 'location' are accepted by POST /users on
+        # every python-gitlab release we support, so a single create call
+        # replaces the old create-then-save() pair of round-trips
         self.gluser = self.gl.users.create(self.userdict)
-        # 'organization' and 'location' field are not created by current
-        # version of python-gitlab (0.20) so add them using .save() method
-        self.gluser.organization = self.userdict['organization']
-        self.gluser.location = self.userdict['location']
-        self.gluser.save()
-        print("    User {} created".format(self.userdict['username']))
+        # Record the new account so _check rejects duplicates later in
+        # the same run without refetching the user list
+        entries = _existing_entries(self.gl)
+        with _existing_entries_lock:
+            entries['usernames'].add(self.userdict['username'])
+            entries['emails'].add(self.userdict['email'])
+            entries['names'].add(self.userdict['name'])
+        print(f"    User {self.userdict['username']} created")
 
     def _add_to_group(self):
 
         print("Adding to group...")
         if self.group:
-            try:
-                group = self.gl.groups.get(self.group['name'])
-            except gitlab.GitlabGetError as e:
-                if e.response_body == 'Group Not Found':
-                    sys.exit("Group {} not found".format(self.group['name']))
-                else:
-                    raise
-            access_level = ACCESS_LEVEL[self.group['access_level']]
+            group = _get_gl_group(self.gl, self.group['name'])
+            if group is None:
+                sys.exit("Group {} not found".format(self.group['name']))
+            access_level = _access_levels()[self.group['access_level']]
             group.members.create({'user_id': self.gluser.id,
                                   'access_level': access_level})
-            print("    User {} added to group {}".format(
-                self.userdict['username'], self.group['name']))
+            print(f"    User {self.userdict['username']} "
+                  f"added to group {self.group['name']}")
         else:
             sys.exit("No group for this new user")
 
@@ -439,83 +687,230 @@ class NewUser():
 
         else:
             warn = "Dry run mode" if self.dry_run else "WARNING"
-            print("\n{}: user {} will not be created\n".format(warn,
-                  self.userdict['username']))
+            print(f"\n{warn}: user {self.userdict['username']} "
+                  "will not be created\n")
 
     def __repr__(self):
         """Return a pretty output of user info"""
-        output = self.userdict['name']
-        for entry in 'username', 'email', 'organization', 'location':
-            output = output + """
-    {:12} : {}""".format(entry, self.userdict[entry])
-
+        lines = [self.userdict['name']]
+        lines.extend(f"    {entry:12} : {self.userdict[entry]}"
+                     for entry in ('username', 'email', 'organization',
+                                   'location'))
         if self.group:
-            output = output + """
-    group        : {} (as {})""".format(self.group['name'],
-                                        self.group['access_level'])
-        return output
+            lines.append(f"    group        : {self.group['name']} "
+                         f"(as {self.group['access_level']})")
+        return "\n".join(lines)
 
 
 class OldUser():
     """Handle old users to delete"""
 
-    def __init__(self, username, dry_run=False):
+    # Marks "no lookup done yet", as opposed to "resolved to nothing"
+    _UNRESOLVED = object()
+
+    def __init__(self, username, dry_run=False, gl=None,
+                 user_info=_UNRESOLVED):
         self.username = username
         self.dry_run = dry_run
-        self.gl = connect_to_gitlab()
+        self.gl = connect_to_gitlab() if gl is None else gl
         self.url = self.gl.api_url
-        gl_user_list = self.gl.users.list(username=self.username)
-        if gl_user_list:
-            self.gl_user = gl_user_list[0]
-            self.skip_user = False
-        else:
-            print("WARNING: user {} does not exist".format(self.username))
+        if user_info is self._UNRESOLVED:
+            gl_user_list = self.gl.users.list(username=self.username)
+            if gl_user_list:
+                gl_user = gl_user_list[0]
+                user_info = {'id': gl_user.id,
+                             'name': gl_user.name,
+                             'email': gl_user.email}
+            else:
+                user_info = None
+        if user_info is None:
+            print(f"WARNING: user {self.username} does not exist")
             self.skip_user = True
+        else:
+            # A lazy object is enough to issue the DELETE request
+            self.gl_user = self.gl.users.get(user_info['id'], lazy=True)
+            self.name = user_info['name']
+            self.email = user_info['email']
+            self.skip_user = False
 
     def delete(self):
         if self.skip_user:
-            print("WARNING: user {} will not be deleted".format(
-                  self.username))
+            print(f"WARNING: user {self.username} will not be deleted")
         else:
-            print("User {}:".format(self.gl_user.username))
-            print("    Name: {}".format(self.gl_user.name))
-            print("    Email: {}".format(self.gl_user.email))
+            print(f"User {self.username}:")
+            print(f"    Name: {self.name}")
+            # GraphQL only exposes publicEmail, which may be unset
+            if self.email:
+                print(f"    Email: {self.email}")
 
             if not self.dry_run and query_yes_no("Delete?", default="no"):
                 self.gl_user.delete()
-                print("    User {} deleted".format(self.username))
+                print(f"    User {self.username} deleted")
             else:
                 message = "dry run mode" if self.dry_run \
                           else "deletion aborted"
-                print("    User {} not deleted ({})".format(self.username,
-                                                            message))
+                print(f"    User {self.username} not deleted ({message})")
+
+
+def delete_users(oldusers, dry_run=False):
+    """Delete a batch of users with a single confirmation
+
+    List every account first, ask once, then run the independent DELETE
+    requests through a thread pool instead of prompting per user.
+    """
+    to_delete = []
+    for olduser in oldusers:
+        if olduser.skip_user:
+            print(f"WARNING: user {olduser.username} will not be deleted")
+        else:
+            print(f"User {olduser.username}:")
+            print(f"    Name: {olduser.name}")
+            # GraphQL only exposes publicEmail, which may be unset
+            if olduser.email:
+                print(f"    Email: {olduser.email}")
+            to_delete.append(olduser)
+
+    if not to_delete:
+        return
+    if dry_run:
+        print(f"    {len(to_delete)} user(s) not deleted (dry run mode)")
+    elif query_yes_no(f"Delete these {len(to_delete)} user(s)?",
+                      default="no"):
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [(olduser, executor.submit(olduser.gl_user.delete))
+                       for olduser in to_delete]
+        # The pool has joined here; report every user, failed or not
+        for olduser, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"    User {olduser.username} not deleted: {e}")
+            else:
+                print(f"    User {olduser.username} deleted")
+    else:
+        print(f"    {len(to_delete)} user(s) not deleted (deletion aborted)")
 
 
 def get_usernames_from_csv(filename):
-    """Return a list of usernames"""
-    with open(filename, 'r') as csvfile:
-        csvreader = csv.reader(row for row in csvfile
-                               if not row.startswith('#'))
-        return [row[0] for row in csvreader]
+    """Yield the usernames read from a csv (or plain text) file"""
+    with open(filename, 'r', buffering=1 << 20) as csvfile:
+        # Only the first column matters: slice each line up to the first
+        # comma instead of running the full csv parser
+        for line in csvfile:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            yield line.split(',', 1)[0].strip()
 
 
 def get_users_from_csv(filename):
-    """Return a dict containing users information"""
-    with open(filename, 'r') as csvfile:
-        fieldnames = 'username', 'name', 'email', 'organization', 'location', \
-                     'group', 'access_level'
-        # Filter csv file header
-        csvreader = csv.reader(row for row in csvfile
-                               if not row.startswith('#'))
-        stripped_reader = [[x.strip() for x in row] for row in csvreader]
-        newusers = [dict(zip_longest(fieldnames, row))
-                    for row in stripped_reader]
+    """Yield a dict of user information per csv row"""
+    with open(filename, 'r', buffering=1 << 20, newline='') as csvfile:
+        # Filter commented lines; DictReader skips blank lines itself
+        # and maps short rows to None through restval
+        filtered = (line for line in csvfile if not line.startswith('#'))
+        csvreader = csv.DictReader(filtered, fieldnames=CSV_FIELDNAMES,
+                                   restval=None)
+        for row in csvreader:
+            userdict = {field: (row[field].strip() if row[field] else None)
+                        for field in CSV_FIELDNAMES}
+            # Validate once at parse time instead of failing against
+            # the API later
+            missing = [field for field in REQUIRED_FIELDS
+                       if not userdict[field]]
+            if missing:
+                sys.exit("Missing {} in csv row: {}".format(
+                    ", ".join(missing), ",".join(str(value) for value
+                                                 in row.values())))
+            yield userdict
+
+
+def run_create(args):
+    """Create the users described in a csv file"""
+    create_file = args.create[0]
+    newuserdicts = get_users_from_csv(create_file)
+    gl = connect_to_gitlab()
+    _clear_http_cache(gl)
+    if args.concurrency > 1:
+        # Creations are independent; bound the pool so GitLab rate
+        # limits are respected. Output lines may interleave.
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            list(executor.map(
+                lambda userdict: NewUser(userdict, dry_run=args.dry_run,
+                                         gl=gl).save(),
+                newuserdicts))
+    else:
+        for userdict in newuserdicts:
+            newuser = NewUser(userdict, dry_run=args.dry_run, gl=gl)
+            newuser.save()
 
-        return newusers
 
+def run_delete_from(args):
+    """Delete the users listed in a text (or csv) file"""
+    oldusernames = list(get_usernames_from_csv(args.delete_from[0]))
 
-def main():
-    """Get user input from command line and launch gitlab API"""
+    gl = connect_to_gitlab()
+    _clear_http_cache(gl)
+    # One GraphQL request instead of one REST lookup per username
+    resolved = _resolve_users_graphql(gl, oldusernames)
+    if resolved is None:
+        oldusers = [OldUser(username, dry_run=args.dry_run, gl=gl)
+                    for username in oldusernames]
+    else:
+        # A username absent from the GraphQL response is unresolved,
+        # not nonexistent: leave it to OldUser's REST lookup
+        oldusers = [OldUser(username, dry_run=args.dry_run, gl=gl,
+                            user_info=resolved.get(username,
+                                                   OldUser._UNRESOLVED))
+                    for username in oldusernames]
+    delete_users(oldusers, dry_run=args.dry_run)
+
+
+def run_delete(args):
+    """Delete a single user"""
+    username = args.delete[0]
+    gl = connect_to_gitlab()
+    _clear_http_cache(gl)
+    olduser = OldUser(username, dry_run=args.dry_run, gl=gl)
+    olduser.delete()
+
+
+def run_list(args):
+    """Print users information to standard output"""
+    activity = ('unused' if args.unused else
+                'sign_in' if args.sign_in else
+                'active' if args.active else None)
+
+    if args.g:
+        glu = GLGroups(args.g, args.gitlab, args.email_only,
+                       args.export_keys, args.username, activity,
+                       args.sign_in_date, args.name_only,
+                       sort=not args.no_sort)
+    elif args.u:
+        glu = GLSingleUser(args.u, args.gitlab, args.email_only,
+                           args.export_keys, args.username, activity,
+                           args.sign_in_date, args.name_only,
+                           sort=not args.no_sort)
+    else:
+        glu = GLUsers(args.gitlab, args.email_only,
+                      args.export_keys, args.username, activity,
+                      args.sign_in_date, args.name_only,
+                      sort=not args.no_sort)
+    if args.csv_out:
+        glu.out_csv()
+    else:
+        glu.output()
+
+
+# Dispatch table: first argparse dest that is set wins, run_list is the
+# default command
+COMMANDS = (('create', run_create),
+            ('delete_from', run_delete_from),
+            ('delete', run_delete))
+
+
+def build_parser():
+    """Build the command line parser"""
 
     description = ("List GitLab users information and "
                    "automate user accounts creation")
@@ -535,7 +930,8 @@ def main():
 
     arg_filter.add_argument('-u', nargs='?', const='list', required=False,
                             metavar="user",
-                            help="List all users [restrict to a username]")
+                            help="List all users [restrict to one or more "
+                                 "comma-separated usernames]")
 
     parser.add_argument('--email-only', dest='email_only',
                         action='store_true',
@@ -547,6 +943,11 @@ def main():
                         default=False,
                         help="Display only name")
 
+    parser.add_argument('--no-sort', dest='no_sort',
+                        action='store_true',
+                        default=False,
+                        help="Do not sort username/group listings")
+
     arg_show = parser.add_argument_group('Additional info')
 
     arg_show.add_argument('--sign-in-date', dest='sign_in_date',
@@ -591,51 +992,23 @@ def main():
 
     parser.add_argument('-n', '--dry-run', dest='dry_run', action='store_true',
                         help=("Do not commit any change"))
-    args = parser.parse_args()
-
-    if args.create:
-        create_file = args.create[0]
-        newuserdicts = get_users_from_csv(create_file)
-        for userdict in newuserdicts:
-            newuser = NewUser(userdict, dry_run=args.dry_run)
-            newuser.save()
-
-    elif args.delete_from:
-        oldusernames = get_usernames_from_csv(args.delete_from[0])
-
-        for username in oldusernames:
-            olduser = OldUser(username, dry_run=args.dry_run)
-            olduser.delete()
+    parser.add_argument('--concurrency', type=int, default=1,
+                        metavar="N",
+                        help=("Create users with N parallel workers "
+                              "(default: 1, sequential)"))
+    return parser
 
-    elif args.delete:
-        username = args.delete[0]
-        olduser = OldUser(username, dry_run=args.dry_run)
-        olduser.delete()
 
-    else:
-        # Print info to standard output
+def main():
+    """Get user input from command line and launch gitlab API"""
 
-        activityd = {'unused': args.unused,
-                     'sign_in': args.sign_in,
-                     'active': args.active}
-        activity = [key for key in activityd.keys() if activityd[key]]
+    args = build_parser().parse_args()
 
-        if args.g:
-            glu = GLGroups(args.g, args.gitlab, args.email_only,
-                           args.export_keys, args.username, activity,
-                           args.sign_in_date, args.name_only)
-        elif args.u:
-            glu = GLSingleUser(args.u, args.gitlab, args.email_only,
-                               args.export_keys, args.username, activity,
-                               args.sign_in_date, args.name_only)
-        else:
-            glu = GLUsers(args.gitlab, args.email_only,
-                          args.export_keys, args.username, activity,
-                          args.sign_in_date, args.name_only)
-        if args.csv_out:
-            glu.out_csv()
-        else:
-            glu.output()
+    for dest, run_command in COMMANDS:
+        if getattr(args, dest):
+            run_command(args)
+            return
+    run_list(args)
 
 
 if __name__ == "__main__":